@@ -34,7 +34,7 @@ def render_api_key_form():
 
     # Create a form for the API key
     with st.form("api_key_form"):
-        api_key = st.text_input("Enter your Google API Key:", type="password")
+        api_key = st.text_input("Enter your Google API Key:", type="password").strip()
         remember = st.checkbox("Save this API key in .env file for future use", value=True)
 
         submitted = st.form_submit_button("Submit", use_container_width=True)
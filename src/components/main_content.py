@@ -33,24 +33,37 @@ def render_input_section():
     return input_text, submit_button, clear_button
 
 
-def display_response(response):
+def display_response(answer_stream):
     """
-    Display the response from the LLM with appropriate styling.
+    Stream the response from the LLM, then display it with appropriate styling.
     
     Args:
-        response (dict): The response from the LLM
+        answer_stream (iterable): Chunks of the answer text from the LLM
+        
+    Returns:
+        str: The full answer text
     """
+    placeholder = st.empty()
+    
+    # Show tokens as they arrive
+    with placeholder.container():
+        st.markdown("### Response:")
+        answer = st.write_stream(answer_stream)
+    
     # Check if the response contains an error message
-    is_error = "ERROR:" in response['answer']
+    is_error = "ERROR:" in answer
     
     # Use appropriate styling based on whether it's an error
     style_class = "error-response" if is_error else "success-response"
     
-    # Display the response with styling
-    st.markdown(f"<div class='{style_class}'>", unsafe_allow_html=True)
-    st.markdown("### Response:")
-    st.markdown(response['answer'])
-    st.markdown("</div>", unsafe_allow_html=True)
+    # Replace the streamed output with the styled response
+    with placeholder.container():
+        st.markdown(f"<div class='{style_class}'>", unsafe_allow_html=True)
+        st.markdown("### Response:")
+        st.markdown(answer)
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    return answer
 
 
 def display_history(history):
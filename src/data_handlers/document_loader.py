@@ -2,15 +2,154 @@
 Document loading and processing utilities for the Healthcare Database Request Assistant.
 """
 
+import glob
+import hashlib
+import itertools
+import json
 import os
 import pickle
+import faiss
+import numpy as np
 import streamlit as st
-from langchain_community.document_loaders import PyPDFDirectoryLoader
+import zstandard
+from concurrent.futures import ThreadPoolExecutor
+from langchain_community.document_loaders import PyPDFLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.embeddings import Embeddings
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
+from langchain_community.docstore.in_memory import InMemoryDocstore
 
-from src.utils.config import CHUNK_SIZE, CHUNK_OVERLAP, EMBEDDING_MODEL, FAISS_INDEX_PATH
+from src.utils.config import (
+    DATA_DIR, CHUNK_SIZE, CHUNK_OVERLAP, EMBEDDING_MODEL, FAISS_INDEX_PATH, ENABLE_ONNX, ONNX_MODEL_FILE,
+    EMBED_BATCH_SIZE, IVF_MIN_VECTORS, IVF_PQ_MIN_VECTORS, IVF_FACTORY, IVF_PQ_FACTORY, IVF_NPROBE,
+    INDEX_DTYPE, EMBED_DIM, ensure_dirs
+)
+
+# Files making up the saved vector index
+INDEX_FILE_PATH = os.path.join(FAISS_INDEX_PATH, "index.faiss")
+DOCSTORE_FILE_PATH = os.path.join(FAISS_INDEX_PATH, "index.pkl.zst")
+# Uncompressed docstore pickle written by FAISS.save_local, still readable
+LEGACY_DOCSTORE_FILE_PATH = os.path.join(FAISS_INDEX_PATH, "index.pkl")
+# Full-dimension float32 embedding of each chunk, in index order, used for reranking
+VECTORS_FILE_PATH = os.path.join(FAISS_INDEX_PATH, "vectors.npy")
+# Fingerprint of the PDFs and settings the saved index was built from
+FINGERPRINT_FILE_PATH = os.path.join(FAISS_INDEX_PATH, "pdf_fingerprint")
+
+# Split chunks are cached next to the vector index, keyed by the PDF contents
+CHUNKS_CACHE_PATH = f"{FAISS_INDEX_PATH}.chunks.pkl.zst"
+
+
+def dump_compressed(obj, path):
+    """
+    Pickle an object with protocol 5 and write it zstd-compressed.
+
+    Args:
+        obj (object): The object to save
+        path (str): Destination file path
+    """
+    data = zstandard.ZstdCompressor(level=3, threads=-1).compress(pickle.dumps(obj, protocol=5))
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def load_compressed(path):
+    """
+    Read an object written by dump_compressed.
+
+    Args:
+        path (str): Source file path
+
+    Returns:
+        object: The unpickled object
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return pickle.loads(zstandard.ZstdDecompressor().decompress(data))
+
+
+class TruncatedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that keeps only the leading dimensions of each vector
+    and renormalizes it, shrinking the index and the cost of each comparison.
+    """
+
+    def __init__(self, base, dim):
+        """
+        Args:
+            base (Embeddings): The full-dimension embeddings model
+            dim (int): Number of leading dimensions to keep
+        """
+        self.base = base
+        self.dim = dim
+
+    def _truncate_array(self, vectors):
+        X = np.asarray(vectors, dtype=np.float32)[..., :self.dim]
+        return X / np.linalg.norm(X, axis=-1, keepdims=True)
+
+    def _truncate(self, vectors):
+        return self._truncate_array(vectors).tolist()
+
+    def embed_documents(self, texts):
+        return self._truncate(self.base.embed_documents(texts))
+
+    def embed_query(self, text):
+        return self._truncate(self.base.embed_query(text))
+
+
+@st.cache_resource
+def load_embedding_model(model_name=EMBEDDING_MODEL):
+    """
+    Load the embeddings model once per process and reuse it across reruns.
+
+    Args:
+        model_name (str): Name of the HuggingFace embedding model
+
+    Returns:
+        HuggingFaceEmbeddings: The shared full-dimension embeddings instance
+    """
+    model_kwargs = {'device': 'cpu'}  # Force CPU usage to avoid CUDA/meta tensor issues
+    if ENABLE_ONNX:
+        # Use the ONNX Runtime backend with the INT8-quantized model export
+        model_kwargs['backend'] = 'onnx'
+        model_kwargs['model_kwargs'] = {'file_name': ONNX_MODEL_FILE}
+
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs=model_kwargs,
+        # Ensure embeddings are normalized. encode() already sorts inputs by
+        # length, so each batch is only padded to its own longest chunk.
+        encode_kwargs={'normalize_embeddings': True, 'batch_size': EMBED_BATCH_SIZE}
+    )
+
+
+def truncate_embeddings(embeddings, dim=EMBED_DIM):
+    """
+    Wrap an embeddings model so it produces vectors of the configured dimension.
+
+    Args:
+        embeddings (Embeddings): The full-dimension embeddings model
+        dim (int or None): Number of leading dimensions to keep, or None for all
+
+    Returns:
+        Embeddings: The wrapped model, or the original one if no truncation is needed
+    """
+    if dim is None:
+        return embeddings
+    return TruncatedEmbeddings(embeddings, dim)
+
+
+def get_embeddings(model_name=EMBEDDING_MODEL):
+    """
+    Get the shared embeddings model used for indexing and querying.
+
+    Args:
+        model_name (str): Name of the HuggingFace embedding model
+
+    Returns:
+        Embeddings: The embeddings model, truncated to EMBED_DIM if configured
+    """
+    return truncate_embeddings(load_embedding_model(model_name))
 
 
 def load_documents(directory_path):
@@ -24,8 +163,11 @@ def load_documents(directory_path):
         list: List of loaded documents or empty list if error occurs
     """
     try:
-        loader = PyPDFDirectoryLoader(directory_path)
-        docs = loader.load()
+        # Parse the PDFs concurrently; pypdf releases the GIL during file IO
+        paths = get_pdf_paths(directory_path)
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            pages = executor.map(lambda path: PyPDFLoader(path).load(), paths)
+            docs = list(itertools.chain.from_iterable(pages))
         return docs
     except Exception as e:
         st.error(f"Error loading documents: {str(e)}")
@@ -51,29 +193,287 @@ def process_documents(docs):
     return documents
 
 
-def create_vectorstore(documents, save_local=True):
+def build_faiss_index(vectors):
+    """
+    Build a FAISS index sized to the number of vectors.
+
+    Small corpora use a flat index. Larger ones use an inverted-file index, with
+    product quantization once the corpus is large enough for the compression to
+    pay off. Uncompressed vectors are stored as INDEX_DTYPE.
+
+    Args:
+        vectors (list): Embedding vectors to index
+
+    Returns:
+        faiss.Index: The populated index
+    """
+    X = np.asarray(vectors, dtype=np.float32)
+    n, dim = X.shape
+
+    use_fp16 = INDEX_DTYPE == "float16"
+
+    if n < IVF_MIN_VECTORS:
+        if use_fp16:
+            index = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_L2)
+            index.train(X)
+        else:
+            index = faiss.IndexFlatL2(dim)
+    else:
+        if n < IVF_PQ_MIN_VECTORS:
+            factory = f"{IVF_FACTORY},{'SQfp16' if use_fp16 else 'Flat'}"
+        else:
+            factory = IVF_PQ_FACTORY
+        index = faiss.index_factory(dim, factory)
+        index.train(X)
+        faiss.extract_index_ivf(index).nprobe = IVF_NPROBE
+
+    index.add(X)
+    return index
+
+
+def build_vectorstore(documents, embeddings):
+    """
+    Embed document chunks and build a FAISS vector store from them.
+
+    Chunks are embedded once at full dimension; a truncating model only cuts
+    those vectors down for the index.
+
+    Args:
+        documents (list): List of document chunks to embed
+        embeddings (Embeddings): The embeddings model to use
+
+    Returns:
+        tuple: (vectorstore, vectors) - the FAISS vector store, and the
+               full-dimension embedding of each chunk in index order
+    """
+    texts = [doc.page_content for doc in documents]
+    if isinstance(embeddings, TruncatedEmbeddings):
+        vectors = np.asarray(embeddings.base.embed_documents(texts), dtype=np.float32)
+        index = build_faiss_index(embeddings._truncate_array(vectors))
+    else:
+        vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+        index = build_faiss_index(vectors)
+
+    vectorstore = FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore({str(i): doc for i, doc in enumerate(documents)}),
+        index_to_docstore_id={i: str(i) for i in range(len(documents))}
+    )
+    return vectorstore, vectors
+
+
+def get_pdf_paths(directory_path):
+    """
+    List the PDF files under a directory in a stable order.
+
+    Matches PyPDFDirectoryLoader: PDFs in subdirectories are included, and
+    hidden files and files inside hidden directories are skipped.
+
+    Args:
+        directory_path (str): Path to the directory containing PDF files
+
+    Returns:
+        list: Sorted list of PDF file paths
+    """
+    paths = glob.glob(os.path.join(directory_path, "**", "*.pdf"), recursive=True)
+    return sorted(
+        path for path in paths
+        if os.path.isfile(path)
+        and not any(part.startswith(".") for part in os.path.relpath(path, directory_path).split(os.sep))
+    )
+
+
+def compute_documents_key(directory_path):
+    """
+    Hash the PDF contents together with the chunking parameters.
+
+    Args:
+        directory_path (str): Path to the directory containing PDF files
+
+    Returns:
+        str: Hex digest identifying the current set of document chunks
+    """
+    hasher = hashlib.blake2b()
+    for path in get_pdf_paths(directory_path):
+        with open(path, "rb") as f:
+            hasher.update(f.read())
+    hasher.update(f"{CHUNK_SIZE}:{CHUNK_OVERLAP}".encode())
+    return hasher.hexdigest()
+
+
+def compute_mtime_fingerprint(directory_path):
+    """
+    Hash the PDF file names and modification times without reading the files.
+
+    Args:
+        directory_path (str): Path to the directory containing PDF files
+
+    Returns:
+        str: Hex digest of the PDF names and modification times
+    """
+    hasher = hashlib.blake2b()
+    for path in get_pdf_paths(directory_path):
+        hasher.update(f"{os.path.relpath(path, directory_path)}:{os.path.getmtime(path)}\n".encode())
+    return hasher.hexdigest()
+
+
+def get_index_settings():
+    """
+    Collect the settings that determine the contents of the saved vector index.
+
+    Returns:
+        dict: Setting names mapped to their current values
+    """
+    return {
+        "CHUNK_SIZE": CHUNK_SIZE,
+        "CHUNK_OVERLAP": CHUNK_OVERLAP,
+        "EMBEDDING_MODEL": EMBEDDING_MODEL,
+        "ENABLE_ONNX": ENABLE_ONNX,
+        "ONNX_MODEL_FILE": ONNX_MODEL_FILE,
+        "EMBED_DIM": EMBED_DIM,
+        "INDEX_DTYPE": INDEX_DTYPE,
+        "IVF_MIN_VECTORS": IVF_MIN_VECTORS,
+        "IVF_PQ_MIN_VECTORS": IVF_PQ_MIN_VECTORS,
+        "IVF_FACTORY": IVF_FACTORY,
+        "IVF_PQ_FACTORY": IVF_PQ_FACTORY,
+        "IVF_NPROBE": IVF_NPROBE,
+    }
+
+
+def compute_fingerprint(directory_path):
+    """
+    Fingerprint the PDFs and settings a vector index is about to be built from.
+
+    Call this before loading the PDFs. The modification times are taken before
+    the contents are hashed, so a PDF replaced during the build makes the saved
+    index fail the content check instead of passing the mtime check.
+
+    Args:
+        directory_path (str): Path to the directory containing PDF files
+
+    Returns:
+        dict: The settings, mtime digest and content key
+    """
+    return {
+        "settings": get_index_settings(),
+        "mtime": compute_mtime_fingerprint(directory_path),
+        "content": compute_documents_key(directory_path),
+    }
+
+
+def save_fingerprint(fingerprint):
+    """
+    Record which PDFs and settings the saved vector index was built from.
+
+    Args:
+        fingerprint (dict or None): Fingerprint from compute_fingerprint, or None
+            if unknown, in which case the index is treated as stale on next load
+    """
+    if fingerprint is None:
+        if os.path.exists(FINGERPRINT_FILE_PATH):
+            os.remove(FINGERPRINT_FILE_PATH)
+        return
+    with open(FINGERPRINT_FILE_PATH, "w") as f:
+        json.dump(fingerprint, f)
+
+
+def is_vectorstore_current(directory_path):
+    """
+    Check whether the saved vector index was built from the current PDFs and settings.
+
+    The chunking, embedding and index settings must match exactly. Matching PDF
+    modification times are then trusted without reading the PDFs; only when
+    they differ are the file contents hashed and compared.
+
+    Args:
+        directory_path (str): Path to the directory containing PDF files
+
+    Returns:
+        bool: True if the index matches, False if it is stale or unverifiable
+    """
+    try:
+        with open(FINGERPRINT_FILE_PATH) as f:
+            fingerprint = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if fingerprint.get("settings") != get_index_settings():
+        return False
+
+    mtime = compute_mtime_fingerprint(directory_path)
+    if fingerprint.get("mtime") == mtime:
+        return True
+    if fingerprint.get("content") != compute_documents_key(directory_path):
+        return False
+
+    # The files were touched but not changed; refresh the mtimes for the fast path
+    try:
+        fingerprint["mtime"] = mtime
+        with open(FINGERPRINT_FILE_PATH, "w") as f:
+            json.dump(fingerprint, f)
+    except OSError:
+        pass
+    return True
+
+
+def load_document_chunks(directory_path, key=None):
+    """
+    Load and split the PDF documents, reusing the cached chunks if the PDFs are unchanged.
+
+    Args:
+        directory_path (str): Path to the directory containing PDF files
+        key (str): Content key from compute_documents_key, if already computed
+
+    Returns:
+        list: List of processed document chunks or empty list if no documents were found
+    """
+    if key is None:
+        key = compute_documents_key(directory_path)
+
+    try:
+        if os.path.exists(CHUNKS_CACHE_PATH):
+            cached_key, documents = load_compressed(CHUNKS_CACHE_PATH)
+            if cached_key == key:
+                return documents
+    except Exception as e:
+        st.warning(f"Ignoring unreadable chunk cache: {str(e)}")
+
+    docs = load_documents(directory_path)
+    if not docs:
+        return []
+
+    documents = process_documents(docs)
+
+    try:
+        ensure_dirs()
+        dump_compressed((key, documents), CHUNKS_CACHE_PATH)
+    except Exception as e:
+        st.warning(f"Could not save chunk cache: {str(e)}")
+
+    return documents
+
+
+def create_vectorstore(documents, save_local=True, fingerprint=None):
     """
     Create a vector store from documents using HuggingFace embeddings.
 
     Args:
         documents (list): List of document chunks to embed
         save_local (bool): Whether to save the vectorstore locally
+        fingerprint (dict): Fingerprint of the PDFs the documents were loaded
+            from, taken with compute_fingerprint before loading them
 
     Returns:
         FAISS: Vector store containing document embeddings
     """
     try:
-        # Initialize embeddings with additional parameters to avoid meta tensor issues
-        embeddings = HuggingFaceEmbeddings(
-            model_name=EMBEDDING_MODEL,
-            model_kwargs={'device': 'cpu'},  # Force CPU usage to avoid CUDA/meta tensor issues
-            encode_kwargs={'normalize_embeddings': True}  # Ensure embeddings are normalized
-        )
-        vectorstore = FAISS.from_documents(documents=documents, embedding=embeddings)
+        embeddings = get_embeddings()
+        vectorstore, vectors = build_vectorstore(documents, embeddings)
 
         # Save the vectorstore locally if requested
         if save_local:
-            save_vectorstore(vectorstore)
+            save_vectorstore(vectorstore, vectors, fingerprint)
 
         return vectorstore
     except Exception as e:
@@ -81,11 +481,11 @@ def create_vectorstore(documents, save_local=True):
         # Fallback to a simpler initialization if the first attempt fails
         try:
             st.info("Trying alternative embedding initialization...")
-            embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-            vectorstore = FAISS.from_documents(documents=documents, embedding=embeddings)
+            embeddings = truncate_embeddings(HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2"))
+            vectorstore, vectors = build_vectorstore(documents, embeddings)
 
             if save_local:
-                save_vectorstore(vectorstore)
+                save_vectorstore(vectorstore, vectors, fingerprint)
 
             return vectorstore
         except Exception as e2:
@@ -93,36 +493,100 @@ def create_vectorstore(documents, save_local=True):
             return None
 
 
-def save_vectorstore(vectorstore):
+def save_vectorstore(vectorstore, vectors, fingerprint=None):
     """
     Save the vectorstore to disk.
 
     Args:
         vectorstore (FAISS): The vectorstore to save
+        vectors (np.ndarray): Full-dimension embedding of each chunk, in index order
+        fingerprint (dict): Fingerprint of the PDFs the vectorstore was built from
     """
     try:
-        vectorstore.save_local(FAISS_INDEX_PATH)
+        ensure_dirs()
+        os.makedirs(FAISS_INDEX_PATH, exist_ok=True)
+        faiss.write_index(vectorstore.index, INDEX_FILE_PATH)
+        np.save(VECTORS_FILE_PATH, vectors)
+        dump_compressed((vectorstore.docstore, vectorstore.index_to_docstore_id), DOCSTORE_FILE_PATH)
+        save_fingerprint(fingerprint)
         st.success("Vector index saved successfully!")
     except Exception as e:
         st.error(f"Error saving vector index: {str(e)}")
 
 
+def read_vectorstore(embeddings):
+    """
+    Read the saved vectorstore, memory-mapping the FAISS index where possible.
+
+    FAISS only maps the inverted lists of IVF indexes stored in the plain array
+    format (IVF_FACTORY with Flat or SQfp16), so for those only the lists probed
+    by a search are read from disk. Fast-scan PQ lists (the default
+    IVF_PQ_FACTORY) and flat or scalar-quantized indexes, used for corpora below
+    IVF_MIN_VECTORS, are read fully into memory.
+
+    Args:
+        embeddings (Embeddings): The embeddings model used to embed queries
+
+    Returns:
+        FAISS: The loaded vectorstore
+    """
+    index = faiss.read_index(INDEX_FILE_PATH, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+
+    # Other indexes are already in memory, so there is nothing to prefetch
+    ivf = faiss.try_extract_index_ivf(index)
+    is_mapped = ivf is not None and isinstance(
+        faiss.downcast_InvertedLists(ivf.invlists), faiss.OnDiskInvertedLists
+    )
+
+    if is_mapped and hasattr(os, "posix_fadvise"):
+        fd = os.open(INDEX_FILE_PATH, os.O_RDONLY)
+        try:
+            # Prefetch the whole file in the background so the first query
+            # does not stall on page faults
+            os.posix_fadvise(fd, 0, os.fstat(fd).st_size, os.POSIX_FADV_WILLNEED)
+            st.toast("Prefetching vector index into memory...")
+        finally:
+            os.close(fd)
+
+    if os.path.exists(DOCSTORE_FILE_PATH):
+        docstore, index_to_docstore_id = load_compressed(DOCSTORE_FILE_PATH)
+    else:
+        with open(LEGACY_DOCSTORE_FILE_PATH, "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id
+    )
+
+
+def load_full_vectors():
+    """
+    Memory-map the full-dimension chunk embeddings saved with the vector index.
+
+    Returns:
+        np.ndarray or None: Array of shape (n, d) in index order, or None if the
+            index was saved without them
+    """
+    if not os.path.exists(VECTORS_FILE_PATH):
+        return None
+    return np.load(VECTORS_FILE_PATH, mmap_mode="r")
+
+
 def load_vectorstore():
     """
     Load the vectorstore from disk if it exists.
 
+    This does not check whether the saved index is current; see is_vectorstore_current.
+
     Returns:
         FAISS or None: The loaded vectorstore or None if it doesn't exist
     """
     try:
-        if os.path.exists(f"{FAISS_INDEX_PATH}.faiss"):
-            # Initialize embeddings with additional parameters to avoid meta tensor issues
-            embeddings = HuggingFaceEmbeddings(
-                model_name=EMBEDDING_MODEL,
-                model_kwargs={'device': 'cpu'},  # Force CPU usage to avoid CUDA/meta tensor issues
-                encode_kwargs={'normalize_embeddings': True}  # Ensure embeddings are normalized
-            )
-            vectorstore = FAISS.load_local(FAISS_INDEX_PATH, embeddings)
+        if os.path.exists(INDEX_FILE_PATH):
+            vectorstore = read_vectorstore(get_embeddings())
             st.success("Loaded existing vector index!")
             return vectorstore
         return None
@@ -130,10 +594,10 @@ def load_vectorstore():
         st.error(f"Error loading vector index: {str(e)}")
         # Try fallback method
         try:
-            if os.path.exists(f"{FAISS_INDEX_PATH}.faiss"):
+            if os.path.exists(INDEX_FILE_PATH):
                 st.info("Trying alternative embedding initialization for loading...")
-                embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-                vectorstore = FAISS.load_local(FAISS_INDEX_PATH, embeddings)
+                embeddings = truncate_embeddings(HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2"))
+                vectorstore = read_vectorstore(embeddings)
                 st.success("Loaded existing vector index with alternative method!")
                 return vectorstore
         except Exception as e2:
@@ -141,6 +605,59 @@ def load_vectorstore():
         return None
 
 
+@st.cache_resource
+def _load_or_build_vectorstore(_is_current):
+    """
+    Load the saved vectorstore, or build and save it from the PDFs, once per process.
+
+    Args:
+        _is_current (bool): Whether the saved index matches the PDFs and settings
+            (excluded from the cache key)
+
+    Returns:
+        FAISS or None: The vectorstore, or None if no documents could be indexed
+    """
+    vectorstore = None
+    if _is_current:
+        vectorstore = load_vectorstore()
+    elif os.path.exists(INDEX_FILE_PATH):
+        st.info("Documents or index settings changed since the vector index was built. Rebuilding the index.")
+
+    # If not available, create a new one
+    if vectorstore is None:
+        st.info("Attempting to load documents")
+        fingerprint = compute_fingerprint(DATA_DIR)
+        documents = load_document_chunks(DATA_DIR, key=fingerprint["content"])
+
+        if not documents:
+            st.warning(f"No documents found in {DATA_DIR}. Please check the path.")
+        else:
+            vectorstore = create_vectorstore(documents, save_local=True, fingerprint=fingerprint)
+
+    return vectorstore
+
+
+def get_vectorstore():
+    """
+    Get the vectorstore shared by all sessions.
+
+    The shared copy is dropped and rebuilt when the saved index no longer matches
+    the PDFs or has been reset. A failed build is not kept, so the next session
+    retries it.
+
+    Returns:
+        FAISS or None: The vectorstore, or None if no documents could be indexed
+    """
+    is_current = is_vectorstore_current(DATA_DIR)
+    if not is_current:
+        _load_or_build_vectorstore.clear()
+
+    vectorstore = _load_or_build_vectorstore(is_current)
+    if vectorstore is None:
+        _load_or_build_vectorstore.clear()
+    return vectorstore
+
+
 def reset_vectorstore():
     """
     Delete the saved vectorstore files.
@@ -149,10 +666,11 @@ def reset_vectorstore():
         bool: True if successful, False otherwise
     """
     try:
-        if os.path.exists(f"{FAISS_INDEX_PATH}.faiss"):
-            os.remove(f"{FAISS_INDEX_PATH}.faiss")
-        if os.path.exists(f"{FAISS_INDEX_PATH}.pkl"):
-            os.remove(f"{FAISS_INDEX_PATH}.pkl")
+        if os.path.exists(INDEX_FILE_PATH):
+            os.remove(INDEX_FILE_PATH)
+        for path in (DOCSTORE_FILE_PATH, LEGACY_DOCSTORE_FILE_PATH, VECTORS_FILE_PATH, FINGERPRINT_FILE_PATH):
+            if os.path.exists(path):
+                os.remove(path)
         st.success("Vector index reset successfully!")
         return True
     except Exception as e:
@@ -2,13 +2,19 @@
 LLM chain setup for the Healthcare Database Request Assistant.
 """
 
+import itertools
 import os
+import threading
+import weakref
+import streamlit as st
 from langchain.chains import create_retrieval_chain
 from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
 
-from src.utils.config import LLM_MODEL
+from src.data_handlers.document_loader import load_embedding_model, load_full_vectors
+from src.models.rerank import RerankingRetriever
+from src.utils.api_validator import get_llm
+from src.utils.config import ENABLE_RERANK, RERANK_FETCH_K
 
 
 def get_prompt_template():
@@ -85,51 +91,115 @@ Explanation:
     )
 
 
-def setup_llm_chain():
+# The prompt is static, so build it once at import
+PROMPT = get_prompt_template()
+
+
+@st.cache_resource
+def get_document_chain(api_key):
     """
-    Set up the LLM chain with the prompt template.
+    Create the document chain once per API key.
+
+    Args:
+        api_key (str): The Google API key
 
     Returns:
         Chain: The document chain for processing requests
+    """
+    return create_stuff_documents_chain(llm=get_llm(api_key), prompt=PROMPT)
 
-    Raises:
-        ValueError: If the API key is not available or invalid
+
+def get_api_key():
     """
-    prompt = get_prompt_template()
+    Get the Google API key from environment variables.
+
+    Returns:
+        str: The API key
 
-    # Get the API key from environment variables
+    Raises:
+        ValueError: If the API key is not available
+    """
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("Google API key not found. Please provide a valid API key.")
+    return api_key
 
-    try:
-        # Initialize the LLM with the API key
-        llm = ChatGoogleGenerativeAI(model=LLM_MODEL, api_key=api_key)
 
-        # Create the document chain
-        document_chain = create_stuff_documents_chain(llm=llm, prompt=prompt)
-        return document_chain
-    except Exception as e:
-        # Handle API key validation errors or other issues
-        raise ValueError(f"Error initializing LLM: {str(e)}. Please check your API key.")
+# Cache keys handed out to vectorstores. Unlike id(), a key is never reused by
+# a later vectorstore once the one it was given to has been garbage collected.
+_vectorstore_keys = weakref.WeakKeyDictionary()
+_vectorstore_key_counter = itertools.count()
+_vectorstore_keys_lock = threading.Lock()
+
+
+def vectorstore_key(vectorstore):
+    """
+    Get the cache key identifying a vectorstore.
+
+    Args:
+        vectorstore (FAISS): The vectorstore
+
+    Returns:
+        int: A key unique to this vectorstore for the life of the process
+    """
+    with _vectorstore_keys_lock:
+        if vectorstore not in _vectorstore_keys:
+            _vectorstore_keys[vectorstore] = next(_vectorstore_key_counter)
+        return _vectorstore_keys[vectorstore]
+
 
+# Each chain pins its vectorstore, so only keep chains for the few in use
+# (normally the shared index and the mock)
+@st.cache_resource(max_entries=4)
+def _get_retrieval_chain(source_key, api_key, k, _vectorstore):
+    """
+    Build the retrieval chain once per vectorstore, API key and top-k.
+
+    The vectorstore itself is not hashable, so the cache is keyed on vectorstore_key.
 
-def create_retrieval_chain_with_vectorstore(vectorstore):
+    Args:
+        source_key (int): Cache key of the vectorstore
+        api_key (str): The Google API key
+        k (int): Number of document chunks to retrieve per request
+        _vectorstore (FAISS): The vectorstore to use for retrieval
+
+    Returns:
+        Chain: The retrieval chain for processing requests
+    """
+    # Reranking needs the saved full-dimension vectors of this index; the mock
+    # vectorstore and indexes saved before they were kept go without it
+    vectors = load_full_vectors() if ENABLE_RERANK else None
+    if vectors is not None and len(vectors) == _vectorstore.index.ntotal:
+        retriever = RerankingRetriever(
+            vectorstore=_vectorstore,
+            vectors=vectors,
+            embeddings=load_embedding_model(),  # Full-dimension query for exact scoring
+            fetch_k=RERANK_FETCH_K,
+            k=k
+        )
+    else:
+        retriever = _vectorstore.as_retriever(search_kwargs={"k": k})
+    return create_retrieval_chain(retriever, get_document_chain(api_key))
+
+
+def create_retrieval_chain_with_vectorstore(vectorstore, k=4):
     """
     Create a retrieval chain using the vectorstore and document chain.
 
     Args:
         vectorstore (FAISS): The vectorstore to use for retrieval
+        k (int): Number of document chunks to retrieve per request
 
     Returns:
         Chain: The retrieval chain for processing requests
-    """
-    # Get the retriever from the vectorstore
-    retriever = vectorstore.as_retriever()
 
-    # Set up the document chain
-    document_chain = setup_llm_chain()
+    Raises:
+        ValueError: If the API key is not available or invalid
+    """
+    api_key = get_api_key()
 
-    # Create the retrieval chain
-    retrieval_chain = create_retrieval_chain(retriever, document_chain)
-    return retrieval_chain
+    try:
+        return _get_retrieval_chain(vectorstore_key(vectorstore), api_key, k, vectorstore)
+    except Exception as e:
+        # Handle API key validation errors or other issues
+        raise ValueError(f"Error initializing LLM: {str(e)}. Please check your API key.")
@@ -0,0 +1,106 @@
+"""
+Cosine-similarity reranking for the Healthcare Database Request Assistant retriever.
+"""
+
+from typing import Any, List
+
+import numpy as np
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+try:
+    import numba
+except ImportError:  # numba is optional; fall back to NumPy
+    numba = None
+
+
+def _cosine_scores_numpy(q, V):
+    """
+    Compute the cosine similarity between a query vector and each row of a matrix.
+
+    Args:
+        q (np.ndarray): Query vector of shape (d,)
+        V (np.ndarray): Candidate vectors of shape (n, d)
+
+    Returns:
+        np.ndarray: Similarity scores of shape (n,)
+    """
+    norms = np.linalg.norm(V, axis=1) * np.linalg.norm(q)
+    return (V @ q) / np.maximum(norms, 1e-12)
+
+
+# Same computation as _cosine_scores_numpy, compiled into a parallel loop
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_scores(q, V):
+        q_norm = 0.0
+        for j in range(q.shape[0]):
+            q_norm += q[j] * q[j]
+        q_norm = np.sqrt(q_norm)
+
+        scores = np.empty(V.shape[0], dtype=np.float32)
+        for i in numba.prange(V.shape[0]):
+            dot = 0.0
+            v_norm = 0.0
+            for j in range(V.shape[1]):
+                dot += q[j] * V[i, j]
+                v_norm += V[i, j] * V[i, j]
+            scores[i] = dot / max(np.sqrt(v_norm) * q_norm, 1e-12)
+        return scores
+else:
+    _cosine_scores = _cosine_scores_numpy
+
+
+def cosine_topk(q, V, k):
+    """
+    Find the k rows of a matrix most similar to a query vector.
+
+    Args:
+        q (np.ndarray): Query vector of shape (d,)
+        V (np.ndarray): Candidate vectors of shape (n, d)
+        k (int): Number of rows to return
+
+    Returns:
+        np.ndarray: Row indices of the top k candidates, most similar first
+    """
+    scores = _cosine_scores(np.ascontiguousarray(q, dtype=np.float32),
+                            np.ascontiguousarray(V, dtype=np.float32))
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+class RerankingRetriever(BaseRetriever):
+    """
+    Retriever that fetches a wide candidate set from the vectorstore and
+    reranks it by exact cosine similarity.
+
+    This recovers ranking quality lost to a compressed or truncated index, since
+    candidates are re-scored against the full-precision embeddings saved with
+    the index. Only the query is embedded per request.
+    """
+
+    vectorstore: Any
+    vectors: Any
+    embeddings: Any
+    fetch_k: int = 50
+    k: int = 4
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        q = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+
+        # Search with the query cut to the index dimension and renormalized, as
+        # TruncatedEmbeddings does, instead of embedding the query a second time
+        index = self.vectorstore.index
+        q_index = q[:index.d] / np.linalg.norm(q[:index.d])
+        _, rows = index.search(q_index[np.newaxis, :], self.fetch_k)
+        rows = rows[0][rows[0] >= 0]
+
+        if len(rows) > self.k:
+            rows = rows[cosine_topk(q, self.vectors[rows], self.k)]
+
+        ids = self.vectorstore.index_to_docstore_id
+        return [self.vectorstore.docstore.search(ids[int(i)]) for i in rows]
@@ -2,29 +2,260 @@
 API key validation utilities for the Healthcare Database Request Assistant.
 """
 
-import os
-from langchain_google_genai import ChatGoogleGenerativeAI
-from src.utils.config import LLM_MODEL
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+import diskcache
+from src.utils.config import LLM_MODEL, CACHE_DIR
+
+__all__ = ["validate_api_key", "get_llm"]
+
+# Validation results are cached by key hash, in memory and on disk so they
+# survive restarts; failures expire sooner so typos aren't sticky
+_CACHE_TTL = 300
+_NEGATIVE_CACHE_TTL = 30
+_validation_cache = {}
+_cache_lock = threading.Lock()
+
+# Failed validations are throttled per key prefix with a token bucket holding up
+# to _BUCKET_CAPACITY attempts, refilled at _BUCKET_REFILL_RATE per second
+_BUCKET_CAPACITY = 5
+_BUCKET_REFILL_RATE = 1.0
+_buckets = {}
+_bucket_lock = threading.Lock()
+
+# Shape of a Google API key: "AIza" followed by 35 URL-safe characters
+_KEY_RE = re.compile(r'^AIza[0-9A-Za-z_\-]{35}$')
+
+
+def _hash_key(api_key):
+    """
+    Hash the API key so the raw key is never stored in the cache.
+
+    Args:
+        api_key (str): The API key to hash
+
+    Returns:
+        str: Hex digest of the API key
+    """
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+
+def _refill(bucket_id, now):
+    """
+    Compute the tokens available in a bucket. Call with _bucket_lock held.
+
+    Args:
+        bucket_id (str): Hash of the key prefix the bucket belongs to
+        now (float): Current monotonic time
+
+    Returns:
+        float: Number of tokens available
+    """
+    tokens, last = _buckets.get(bucket_id, (_BUCKET_CAPACITY, now))
+    return min(_BUCKET_CAPACITY, tokens + (now - last) * _BUCKET_REFILL_RATE)
+
+
+def _prune_buckets(now):
+    """
+    Drop the buckets that have refilled completely. Call with _bucket_lock held.
+
+    A missing bucket behaves like a full one, so this only frees memory.
+
+    Args:
+        now (float): Current monotonic time
+    """
+    for bucket_id in [b for b in _buckets if _refill(b, now) >= _BUCKET_CAPACITY]:
+        del _buckets[bucket_id]
+
+
+def _is_throttled(bucket_id):
+    """
+    Check whether too many validations have failed recently for a key prefix.
+
+    Args:
+        bucket_id (str): Hash of the key prefix
+
+    Returns:
+        bool: True if the bucket is empty
+    """
+    with _bucket_lock:
+        return _refill(bucket_id, time.monotonic()) < 1
+
+
+def _record_failure(bucket_id):
+    """
+    Take a token from the bucket of a key prefix after a failed validation.
+
+    Args:
+        bucket_id (str): Hash of the key prefix
+    """
+    with _bucket_lock:
+        now = time.monotonic()
+        _prune_buckets(now)
+        _buckets[bucket_id] = (_refill(bucket_id, now) - 1, now)
+
+
+def _is_fresh(entry, now):
+    """
+    Check whether an in-memory validation result is still within its TTL.
+
+    Args:
+        entry (tuple): (is_valid, error_message, timestamp)
+        now (float): Current monotonic time
+
+    Returns:
+        bool: True if the result can still be used
+    """
+    is_valid, _, timestamp = entry
+    return now - timestamp < (_CACHE_TTL if is_valid else _NEGATIVE_CACHE_TTL)
+
+
+def _cache_result(key_hash, result, timestamp):
+    """
+    Keep a validation result in memory, dropping the entries that have expired.
+
+    Args:
+        key_hash (str): Hash of the API key
+        result (tuple): (is_valid, error_message)
+        timestamp (float): Monotonic time the result was produced
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        for expired in [h for h, entry in _validation_cache.items() if not _is_fresh(entry, now)]:
+            del _validation_cache[expired]
+        _validation_cache[key_hash] = (*result, timestamp)
+
+
+@lru_cache(maxsize=1)
+def _disk_cache():
+    """
+    Open the on-disk validation cache, creating it on first use.
+
+    Returns:
+        diskcache.Cache: The validation cache stored under CACHE_DIR
+    """
+    return diskcache.Cache(str(CACHE_DIR / "apikey"))
+
+
+# The disk cache is only an optimization: on a read-only or locked cache
+# directory, validation carries on with the in-memory cache alone
+_DISK_CACHE_ERRORS = (OSError, sqlite3.Error, diskcache.Timeout)
+
+
+def _disk_get(key_hash):
+    """
+    Read a validation result saved by an earlier process.
+
+    Args:
+        key_hash (str): Hash of the API key
+
+    Returns:
+        tuple: (result, expire_time) - result is (is_valid, error_message), or
+               None if there is no usable entry; expire_time is a Unix timestamp
+    """
+    try:
+        return _disk_cache().get(key_hash, expire_time=True)
+    except _DISK_CACHE_ERRORS:
+        return None, None
+
+
+def _disk_set(key_hash, result, ttl):
+    """
+    Save a validation result for later processes, if the disk cache is writable.
+
+    Args:
+        key_hash (str): Hash of the API key
+        result (tuple): (is_valid, error_message)
+        ttl (float): Seconds until the entry expires
+    """
+    try:
+        _disk_cache().set(key_hash, result, expire=ttl)
+    except _DISK_CACHE_ERRORS:
+        pass
+
+
+@lru_cache(maxsize=8)
+def get_llm(api_key):
+    """
+    Create the Gemini LLM client once per API key.
+
+    Constructing the client is also how a key is validated, so the client built
+    during validation is the one later used to process requests.
+
+    Args:
+        api_key (str): The Google API key
+
+    Returns:
+        ChatGoogleGenerativeAI: The shared LLM client
+    """
+    # Imported here so that importing this module stays cheap until a key is checked
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(model=LLM_MODEL, api_key=api_key)
 
 
 def validate_api_key(api_key):
     """
     Validate the API key by testing the LLM initialization.
-    
+
     Args:
         api_key (str): The API key to validate
-        
+
     Returns:
         tuple: (is_valid, error_message) - is_valid is a boolean indicating if the key is valid,
                error_message is None if valid, otherwise contains the error message
     """
     if not api_key:
         return False, "API key is empty"
-    
+
+    # Reject malformed keys without constructing the client
+    api_key = api_key.strip()
+    if not _KEY_RE.match(api_key):
+        return False, "Malformed API key"
+
+    key_hash = _hash_key(api_key)
+    with _cache_lock:
+        cached = _validation_cache.get(key_hash)
+        if cached is not None and not _is_fresh(cached, time.monotonic()):
+            del _validation_cache[key_hash]
+            cached = None
+    if cached is not None:
+        return cached[0], cached[1]
+
+    # Fall back to results from earlier processes (diskcache handles expiry),
+    # keeping them in memory for the rest of their lifetime
+    cached, expire_time = _disk_get(key_hash)
+    if cached is not None:
+        ttl = _CACHE_TTL if cached[0] else _NEGATIVE_CACHE_TTL
+        remaining = expire_time - time.time() if expire_time is not None else ttl
+        _cache_result(key_hash, cached, time.monotonic() - (ttl - remaining))
+        return tuple(cached)
+
+    # Don't hit the SDK while failures for this key prefix are being throttled
+    bucket_id = _hash_key(api_key[:12])
+    if _is_throttled(bucket_id):
+        return False, "Too many failed attempts. Please wait a few seconds and try again."
+
+    from google.api_core.exceptions import InvalidArgument, PermissionDenied, Unauthenticated
+
     try:
         # Try to initialize the LLM with the provided API key
         # We don't need to generate any text, just test if initialization works
-        ChatGoogleGenerativeAI(model=LLM_MODEL, api_key=api_key)
-        return True, None
+        get_llm(api_key)
+        result = (True, None)
+    except (Unauthenticated, PermissionDenied, InvalidArgument):
+        # The key was definitively rejected, so this result is safe to cache
+        _record_failure(bucket_id)
+        result = (False, "Invalid API key")
     except Exception as e:
-        return False, str(e)
+        # Possibly transient (network, SDK setup), so report it without caching
+        _record_failure(bucket_id)
+        return False, f"Could not validate API key ({type(e).__name__})"
+
+    _cache_result(key_hash, result, time.monotonic())
+    _disk_set(key_hash, result, _CACHE_TTL if result[0] else _NEGATIVE_CACHE_TTL)
+    return result
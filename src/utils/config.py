@@ -4,29 +4,250 @@ Contains paths, model settings, and other configuration parameters.
 """
 
 import os
+import sys
+import warnings
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
 from pathlib import Path
+from typing import Final, Literal, Optional, Union, get_args, get_origin
 
-# Base directories
-BASE_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-FAISS_DIR = os.path.join(BASE_DIR, "faiss")
+try:
+    import yaml
+except ImportError:  # YAML config files are optional
+    yaml = None
 
-# Ensure directories exist
-os.makedirs(FAISS_DIR, exist_ok=True)
+__all__ = [
+    "CFG", "load_config", "ensure_dirs",
+    "BASE_DIR", "DATA_DIR", "FAISS_DIR", "CACHE_DIR", "FAISS_INDEX_PATH",
+    "EMBEDDING_MODEL", "LLM_MODEL", "ENABLE_ONNX", "ONNX_MODEL_FILE", "CHUNK_SIZE",
+    "CHUNK_OVERLAP", "EMBED_BATCH_SIZE", "EMBED_DIM", "IVF_MIN_VECTORS",
+    "IVF_PQ_MIN_VECTORS", "IVF_FACTORY", "IVF_PQ_FACTORY", "IVF_NPROBE", "INDEX_DTYPE",
+    "ENABLE_RERANK", "RERANK_FETCH_K", "PAGE_TITLE", "PAGE_ICON", "PAGE_ICON_UTF8",
+    "PAGE_LAYOUT", "SIDEBAR_STATE",
+]
 
-# File paths
-FAISS_INDEX_PATH = os.path.join(FAISS_DIR, "healthcare_index")
+# Base directory (this file lives in <BASE_DIR>/src/utils)
+_BASE_DIR = Path(__file__).resolve().parents[2]
 
-# Model settings
-EMBEDDING_MODEL = "all-MiniLM-L6-v2"
-LLM_MODEL = "gemini-2.0-flash"
+# Config file locations: an explicit path from the environment, else this file in the CWD
+CONFIG_ENV_VAR = "SQL_ASSISTANT_CONFIG"
+DEFAULT_CONFIG_FILE = "sql_assistant_config.yml"
 
-# Text processing settings
-CHUNK_SIZE = 500
-CHUNK_OVERLAP = 100
+# Settings that can also be overridden directly from the environment
+ENV_OVERRIDES = ("EMBEDDING_MODEL",)
 
-# UI settings
-PAGE_TITLE = "Healthcare DB Assistant"
-PAGE_ICON = "🏥"
-PAGE_LAYOUT = "wide"
-SIDEBAR_STATE = "expanded"
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """
+    Application settings, grouped in a single immutable object.
+    """
+
+    # Base directories
+    BASE_DIR: Path = _BASE_DIR
+    DATA_DIR: Path = _BASE_DIR / "data"
+    FAISS_DIR: Path = _BASE_DIR / "faiss"
+    CACHE_DIR: Path = _BASE_DIR / ".cache"
+
+    # File paths
+    FAISS_INDEX_PATH: Path = _BASE_DIR / "faiss" / "healthcare_index"
+
+    # Model settings
+    EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    LLM_MODEL: str = "gemini-2.0-flash"
+
+    # Run the embedding model on ONNX Runtime with a pre-quantized INT8 export
+    # (requires sentence-transformers>=3.2 with the onnx extra)
+    ENABLE_ONNX: bool = False
+    ONNX_MODEL_FILE: str = "onnx/model_qint8_avx512_vnni.onnx"
+
+    # Text processing settings
+    CHUNK_SIZE: int = 500
+    CHUNK_OVERLAP: int = 100
+
+    # Number of chunks the embeddings model encodes per batch
+    EMBED_BATCH_SIZE: int = 32
+
+    # Keep only the leading dimensions of each embedding (None keeps all 384).
+    # MiniLM is not Matryoshka-trained, so check retrieval quality before lowering
+    # this (128 or 256).
+    EMBED_DIM: Optional[int] = None
+
+    # Vector index settings. Below IVF_MIN_VECTORS chunks a flat index is used;
+    # above it an IVF index, switching to OPQ+PQ compression for large corpora.
+    # Fast-scan PQ lists ("x4fs") are loaded into memory rather than mapped;
+    # use a plain PQ encoding such as "PQ16" to keep them on disk.
+    IVF_MIN_VECTORS: int = 10_000
+    IVF_PQ_MIN_VECTORS: int = 50_000
+    IVF_FACTORY: str = "IVF64"
+    IVF_PQ_FACTORY: str = "OPQ16_64,IVF256_HNSW32,PQ16x4fs"
+    IVF_NPROBE: int = 8
+
+    # Storage type for uncompressed vectors: "float16" halves index memory and
+    # search bandwidth with negligible recall loss, "float32" stores them exactly
+    INDEX_DTYPE: Literal["float16", "float32"] = "float16"
+
+    # Rerank a wider set of retrieved chunks by exact cosine similarity against
+    # the full-dimension vectors saved with the index. Only changes the results
+    # of a lossy (PQ-compressed or EMBED_DIM-truncated) index.
+    ENABLE_RERANK: bool = False
+    RERANK_FETCH_K: int = 50
+
+    # UI settings
+    PAGE_TITLE: str = "Healthcare DB Assistant"
+    PAGE_ICON: str = "🏥"
+    PAGE_LAYOUT: Literal["centered", "wide"] = "wide"
+    SIDEBAR_STATE: Literal["auto", "expanded", "collapsed"] = "expanded"
+
+
+def _read_config_file():
+    """
+    Read setting overrides from the YAML config file, if there is one.
+
+    Returns:
+        dict: Setting names mapped to their override values
+
+    Raises:
+        ValueError: If the file does not contain a mapping of settings
+    """
+    explicit_path = os.getenv(CONFIG_ENV_VAR)
+    path = Path(explicit_path) if explicit_path else Path.cwd() / DEFAULT_CONFIG_FILE
+
+    if not path.is_file():
+        if explicit_path:
+            raise FileNotFoundError(f"Config file set in {CONFIG_ENV_VAR} not found: {path}")
+        return {}
+
+    if yaml is None:
+        if explicit_path:
+            raise ImportError(f"PyYAML is required to read the config file {path}")
+        warnings.warn(f"Ignoring {path}: PyYAML is not installed")
+        return {}
+
+    with open(path) as f:
+        overrides = yaml.safe_load(f) or {}
+    if not isinstance(overrides, dict):
+        raise ValueError(f"Config file {path} must contain a mapping of setting names to values, "
+                         f"not a {type(overrides).__name__}")
+    return overrides
+
+
+def _check_value(name, value, expected):
+    """
+    Check a setting override against the type of its field.
+
+    Args:
+        name (str): The setting name
+        value (object): The override value
+        expected (type): The field type
+
+    Returns:
+        object: The value, converted to a Path for path settings
+
+    Raises:
+        ValueError: If the value does not match the field type
+    """
+    if get_origin(expected) is Literal:
+        if value not in get_args(expected):
+            raise ValueError(f"Invalid value for {name}: {value!r} (expected one of {get_args(expected)})")
+        return value
+
+    if get_origin(expected) is Union:  # Optional[...]
+        if value is None:
+            return value
+        expected = next(arg for arg in get_args(expected) if arg is not type(None))
+
+    if expected is Path and isinstance(value, (str, Path)):
+        return Path(value)
+    # bool is a subclass of int, so "CHUNK_SIZE: true" must not pass as an int
+    if isinstance(value, expected) and not (isinstance(value, bool) and expected is not bool):
+        return value
+    raise ValueError(f"Invalid value for {name}: {value!r} (expected {expected.__name__})")
+
+
+@lru_cache(maxsize=1)
+def load_config():
+    """
+    Load the application settings, once per process.
+
+    Defaults are overridden by the YAML config file (the path in the
+    SQL_ASSISTANT_CONFIG environment variable, else sql_assistant_config.yml in
+    the working directory), then by the environment variables in ENV_OVERRIDES.
+
+    Returns:
+        _Config: The application settings
+
+    Raises:
+        ValueError: If the config file contains unknown settings or values of the wrong type
+    """
+    overrides = _read_config_file()
+    for name in ENV_OVERRIDES:
+        if os.getenv(name):
+            overrides[name] = os.environ[name]
+
+    known = {f.name: f.type for f in fields(_Config)}
+    unknown = sorted(set(overrides) - set(known))
+    if unknown:
+        raise ValueError(f"Unknown configuration settings: {', '.join(unknown)}")
+
+    for name, value in overrides.items():
+        overrides[name] = _check_value(name, value, known[name])
+
+    # Directories not set explicitly follow a relocated BASE_DIR, and the index
+    # follows a relocated FAISS_DIR
+    if "BASE_DIR" in overrides:
+        base_dir = overrides["BASE_DIR"]
+        overrides.setdefault("DATA_DIR", base_dir / "data")
+        overrides.setdefault("FAISS_DIR", base_dir / "faiss")
+        overrides.setdefault("CACHE_DIR", base_dir / ".cache")
+    if "FAISS_DIR" in overrides and "FAISS_INDEX_PATH" not in overrides:
+        overrides["FAISS_INDEX_PATH"] = overrides["FAISS_DIR"] / "healthcare_index"
+
+    config = _Config(**overrides)
+
+    # Intern the string settings so repeated comparisons can short-circuit on identity
+    return replace(config, **{
+        f.name: sys.intern(getattr(config, f.name))
+        for f in fields(config)
+        if isinstance(getattr(config, f.name), str)
+    })
+
+
+CFG = load_config()
+
+# Module-level names kept for existing imports
+BASE_DIR: Final[Path] = CFG.BASE_DIR
+DATA_DIR: Final[Path] = CFG.DATA_DIR
+FAISS_DIR: Final[Path] = CFG.FAISS_DIR
+CACHE_DIR: Final[Path] = CFG.CACHE_DIR
+FAISS_INDEX_PATH: Final[Path] = CFG.FAISS_INDEX_PATH
+EMBEDDING_MODEL: Final[str] = CFG.EMBEDDING_MODEL
+LLM_MODEL: Final[str] = CFG.LLM_MODEL
+ENABLE_ONNX: Final[bool] = CFG.ENABLE_ONNX
+ONNX_MODEL_FILE: Final[str] = CFG.ONNX_MODEL_FILE
+CHUNK_SIZE: Final[int] = CFG.CHUNK_SIZE
+CHUNK_OVERLAP: Final[int] = CFG.CHUNK_OVERLAP
+EMBED_BATCH_SIZE: Final[int] = CFG.EMBED_BATCH_SIZE
+EMBED_DIM: Final[Optional[int]] = CFG.EMBED_DIM
+IVF_MIN_VECTORS: Final[int] = CFG.IVF_MIN_VECTORS
+IVF_PQ_MIN_VECTORS: Final[int] = CFG.IVF_PQ_MIN_VECTORS
+IVF_FACTORY: Final[str] = CFG.IVF_FACTORY
+IVF_PQ_FACTORY: Final[str] = CFG.IVF_PQ_FACTORY
+IVF_NPROBE: Final[int] = CFG.IVF_NPROBE
+INDEX_DTYPE: Final[Literal["float16", "float32"]] = CFG.INDEX_DTYPE
+ENABLE_RERANK: Final[bool] = CFG.ENABLE_RERANK
+RERANK_FETCH_K: Final[int] = CFG.RERANK_FETCH_K
+PAGE_TITLE: Final[str] = CFG.PAGE_TITLE
+PAGE_ICON: Final[str] = CFG.PAGE_ICON
+# Encoded once for code paths that write the icon as raw bytes
+PAGE_ICON_UTF8: Final[bytes] = PAGE_ICON.encode("utf-8")
+PAGE_LAYOUT: Final[Literal["centered", "wide"]] = CFG.PAGE_LAYOUT
+SIDEBAR_STATE: Final[Literal["auto", "expanded", "collapsed"]] = CFG.SIDEBAR_STATE
+
+
+@lru_cache(maxsize=1)
+def ensure_dirs():
+    """
+    Create the directories the application writes to, once per process.
+    """
+    CFG.FAISS_DIR.mkdir(parents=True, exist_ok=True)
@@ -2,46 +2,38 @@
 CSS styles for the Healthcare Database Request Assistant UI.
 """
 
-# Custom CSS for better UI
-CUSTOM_CSS = """
-<style>
-    .main-header {
-        font-family: 'Arial', sans-serif;
-        color: #2c3e50;
-    }
-    .subheader {
-        font-size: 18px;
-        font-weight: 500;
-        color: #34495e;
-    }
-    .query-box {
-        background-color: #f8f9fa;
-        padding: 15px;
-        border-radius: 5px;
-        margin-bottom: 20px;
-    }
-    .success-response {
-        background-color: #eaf7ea;
-        padding: 20px;
-        border-radius: 5px;
-        border-left: 5px solid #28a745;
-    }
-    .error-response {
-        background-color: #f8d7da;
-        padding: 20px;
-        border-radius: 5px;
-        border-left: 5px solid #dc3545;
-    }
-    .stButton>button {
-        background-color: #0066cc;
-        color: white;
-        font-weight: bold;
-        padding: 0.5rem 1rem;
-        border-radius: 5px;
-        border: none;
-    }
-    .stButton>button:hover {
-        background-color: #0056b3;
-    }
-</style>
-"""
+import re
+from pathlib import Path
+from typing import Final
+
+__all__ = ["CUSTOM_CSS", "CUSTOM_CSS_BYTES", "CUSTOM_CSS_SRC", "minify_css"]
+
+# Custom CSS for better UI (readable source; CUSTOM_CSS is the minified form)
+_CSS_PATH = Path(__file__).parent / "static" / "app.css"
+CUSTOM_CSS_SRC = _CSS_PATH.read_text()
+
+
+def minify_css(css):
+    """
+    Minify a stylesheet by removing comments and insignificant whitespace.
+
+    Args:
+        css (str): The stylesheet source
+
+    Returns:
+        str: The minified stylesheet
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    # Whitespace before ':' is significant in selectors ("a :hover" is not
+    # "a:hover"), so only strip it inside declaration blocks
+    css = re.sub(r'\{[^{}]*\}', lambda m: re.sub(r'\s*:\s*', ':', m.group()), css)
+    return css.replace(';}', '}').strip()
+
+
+# Read and minified once per process. Streamlit drops elements a rerun does not
+# emit again, so the style block is still written on every rerun.
+CUSTOM_CSS: Final[str] = f"<style>{minify_css(CUSTOM_CSS_SRC)}</style>"
+# Encoded once for code paths that write the stylesheet as raw bytes
+CUSTOM_CSS_BYTES: Final[bytes] = CUSTOM_CSS.encode("ascii")